@@ -2,4 +2,4 @@ from pathlib import Path
 
 # Define the root directory of the project
 ROOT_DIR = Path(__file__).resolve().parent.parent
-USERS_DIR = ROOT_DIR / "data" / "merged_df.pickle"
\ No newline at end of file
+USERS_DIR = ROOT_DIR / "data" / "merged_df.parquet"
\ No newline at end of file